@@ -20,9 +20,12 @@ def test_api():
     print(f"Response: {response.json()}")
     
     # Test creating an image analysis
+    # Unique name per run - a repeat of a previous run's name would 409
+    # against the unique (image_name, analysis_type) index
     print("\n2. Testing image analysis creation...")
+    image_name = f"test_artwork_{int(datetime.now().timestamp())}.jpg"
     test_data = {
-        "image_name": "test_artwork.jpg",
+        "image_name": image_name,
         "analysis_type": "museum",
         "descriptions": [
             "A beautiful abstract painting with vibrant colors",
@@ -58,11 +61,16 @@ def test_api():
         
         # Test search by name
         print("\n5. Testing search by name...")
-        response = requests.get(f"{BASE_URL}/api/image-analysis/search/test_artwork")
+        response = requests.get(f"{BASE_URL}/api/image-analysis/search/{image_name}")
         print(f"Status: {response.status_code}")
         results = response.json()
         print(f"Search results: {len(results)} found")
-        
+
+        # Test duplicate create rejection
+        print("\n6. Testing duplicate create...")
+        response = requests.post(f"{BASE_URL}/api/image-analysis", json=test_data)
+        print(f"Status: {response.status_code} (expected 409)")
+
     else:
         print(f"Failed to create analysis: {response.text}")
 